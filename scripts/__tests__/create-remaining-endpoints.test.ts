@@ -0,0 +1,148 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { ConflictException, type Method } from '@aws-sdk/client-api-gateway';
+import { CONFLICT_MAX_ATTEMPTS, isEndpointComplete, withConflictRetry } from '../create-remaining-endpoints.js';
+
+// ---------------------------------------------------------------------------
+// Shared test helpers
+// ---------------------------------------------------------------------------
+
+const AUTHORIZER_ID = 'v2uegl';
+
+/** Method map for a fully wired endpoint; POST auth can be overridden. */
+function completeMethods(post: Partial<Method> = {}): Record<string, Method> {
+  return {
+    OPTIONS: {
+      httpMethod: 'OPTIONS',
+      methodResponses: { '200': { statusCode: '200' } },
+      methodIntegration: { type: 'MOCK', integrationResponses: { '200': { statusCode: '200' } } },
+    },
+    POST: {
+      httpMethod: 'POST',
+      authorizationType: 'COGNITO_USER_POOLS',
+      authorizerId: AUTHORIZER_ID,
+      methodIntegration: { type: 'AWS_PROXY' },
+      ...post,
+    },
+  };
+}
+
+function conflict(): ConflictException {
+  return new ConflictException({ message: 'Another operation is in progress', $metadata: {} });
+}
+
+// ---------------------------------------------------------------------------
+// isEndpointComplete
+// ---------------------------------------------------------------------------
+
+describe('isEndpointComplete', () => {
+  it('returns true for a fully wired Cognito endpoint', () => {
+    expect(isEndpointComplete('alerts', completeMethods())).toBe(true);
+  });
+
+  it('returns false when the resource has no methods', () => {
+    expect(isEndpointComplete('alerts', {})).toBe(false);
+  });
+
+  it('returns false when POST has no integration', () => {
+    expect(isEndpointComplete('alerts', completeMethods({ methodIntegration: undefined }))).toBe(false);
+  });
+
+  it('returns false when POST is missing', () => {
+    const { OPTIONS } = completeMethods();
+    expect(isEndpointComplete('alerts', { OPTIONS })).toBe(false);
+  });
+
+  it('returns false when the OPTIONS integration response is missing', () => {
+    const methods = completeMethods();
+    methods.OPTIONS.methodIntegration = { type: 'MOCK' };
+    expect(isEndpointComplete('alerts', methods)).toBe(false);
+  });
+
+  it('returns false when the OPTIONS method response is missing', () => {
+    const methods = completeMethods();
+    methods.OPTIONS.methodResponses = {};
+    expect(isEndpointComplete('alerts', methods)).toBe(false);
+  });
+
+  it('returns false when a Cognito endpoint uses a different authorizer', () => {
+    expect(isEndpointComplete('alerts', completeMethods({ authorizerId: 'other' }))).toBe(false);
+  });
+
+  it('returns false when a Cognito endpoint has no authorization', () => {
+    expect(isEndpointComplete('alerts', completeMethods({ authorizationType: 'NONE', authorizerId: undefined }))).toBe(false);
+  });
+
+  it('returns false when a public endpoint is still behind Cognito', () => {
+    expect(isEndpointComplete('get-executive-dashboard-public', completeMethods())).toBe(false);
+  });
+
+  it('returns true when a public endpoint has no authorization', () => {
+    const methods = completeMethods({ authorizationType: 'NONE', authorizerId: undefined });
+    expect(isEndpointComplete('get-executive-dashboard-public', methods)).toBe(true);
+  });
+});
+
+// ---------------------------------------------------------------------------
+// withConflictRetry
+// ---------------------------------------------------------------------------
+
+describe('withConflictRetry', () => {
+  beforeEach(() => {
+    vi.useFakeTimers();
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it('returns the result without retrying on success', async () => {
+    const call = vi.fn().mockResolvedValue('ok');
+    await expect(withConflictRetry(call)).resolves.toBe('ok');
+    expect(call).toHaveBeenCalledTimes(1);
+  });
+
+  it('retries ConflictException until the call succeeds', async () => {
+    const call = vi.fn()
+      .mockRejectedValueOnce(conflict())
+      .mockRejectedValueOnce(conflict())
+      .mockResolvedValue('ok');
+
+    const result = withConflictRetry(call);
+    await vi.runAllTimersAsync();
+
+    await expect(result).resolves.toBe('ok');
+    expect(call).toHaveBeenCalledTimes(3);
+  });
+
+  it('does not retry other errors', async () => {
+    const call = vi.fn().mockRejectedValue(new Error('AccessDenied'));
+    await expect(withConflictRetry(call)).rejects.toThrow('AccessDenied');
+    expect(call).toHaveBeenCalledTimes(1);
+  });
+
+  it('gives up after CONFLICT_MAX_ATTEMPTS and rethrows the conflict', async () => {
+    const call = vi.fn().mockRejectedValue(conflict());
+
+    const result = withConflictRetry(call);
+    const assertion = expect(result).rejects.toBeInstanceOf(ConflictException);
+    await vi.runAllTimersAsync();
+
+    await assertion;
+    expect(call).toHaveBeenCalledTimes(CONFLICT_MAX_ATTEMPTS);
+  });
+
+  it('retries only errors matched by a custom predicate', async () => {
+    const transient = new Error('An update is in progress');
+    const call = vi.fn()
+      .mockRejectedValueOnce(transient)
+      .mockRejectedValueOnce(conflict());
+    const isTransient = (err: unknown) => err === transient;
+
+    const result = withConflictRetry(call, isTransient);
+    const assertion = expect(result).rejects.toBeInstanceOf(ConflictException);
+    await vi.runAllTimersAsync();
+
+    await assertion;
+    expect(call).toHaveBeenCalledTimes(2);
+  });
+});
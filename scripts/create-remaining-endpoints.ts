@@ -0,0 +1,438 @@
+#!/usr/bin/env npx tsx
+/**
+ * EVO Platform - Create Remaining API Gateway Endpoints
+ *
+ * Creates /api/functions/{endpoint} resources (OPTIONS + POST) on the
+ * production REST API and grants API Gateway permission to invoke the
+ * matching Lambda. All endpoints share one API Gateway client and one
+ * Lambda client, and run concurrently on the event loop (capped by
+ * MAX_PARALLEL).
+ *
+ * Prefer the declarative path for full deployments: generate-cloudformation.ts
+ * and generate-cf-stacks.ts emit the same Resource + OPTIONS/POST Methods +
+ * Lambda Permission per handler, and CloudFormation provisions them in
+ * parallel with no-op re-runs. Use this script only to patch endpoints onto
+ * an API that is not managed by those stacks.
+ *
+ * Usage: npx tsx scripts/create-remaining-endpoints.ts
+ */
+
+import {
+  APIGatewayClient,
+  ConflictException,
+  CreateDeploymentCommand,
+  CreateResourceCommand,
+  DeleteResourceCommand,
+  type Method,
+  PutIntegrationCommand,
+  PutIntegrationResponseCommand,
+  PutMethodCommand,
+  PutMethodResponseCommand,
+  UpdateMethodCommand,
+  paginateGetResources,
+} from '@aws-sdk/client-api-gateway';
+import { AddPermissionCommand, LambdaClient, ResourceConflictException } from '@aws-sdk/client-lambda';
+import { fromIni } from '@aws-sdk/credential-providers';
+import { Agent } from 'https';
+
+const REGION = 'us-east-1';
+const PROFILE = 'EVO_PRODUCTION';
+const API_ID = 's516304ta7';
+const PARENT_ID = 'wywdrc';
+const AUTHORIZER_ID = 'v2uegl';
+const ACCOUNT_ID = '523115032346';
+const LAMBDA_PREFIX = 'evo-uds-v3-prod';
+const MAX_PARALLEL = Number(process.env.MAX_PARALLEL) || 10;
+// ConflictException (concurrent modification of the same REST API) is not retried by the SDK
+export const CONFLICT_MAX_ATTEMPTS = 6;
+const CONFLICT_BASE_DELAY_MS = 500;
+
+const CORS_HEADERS = 'Content-Type,Authorization,X-Requested-With,X-API-Key,X-Request-ID,X-CSRF-Token,X-Correlation-ID,X-Amz-Date,X-Amz-Security-Token,X-Impersonate-Organization';
+const CORS_METHODS = 'GET,POST,PUT,DELETE,OPTIONS';
+
+// Remaining endpoints
+const ENDPOINTS: string[] = [
+  'predict-incidents',
+  'detect-anomalies',
+  'get-ai-notifications',
+  'update-ai-notification',
+  'send-ai-notification',
+  'list-ai-notifications-admin',
+  'manage-notification-rules',
+  'get-executive-dashboard',
+  'get-executive-dashboard-public',
+  'manage-tv-tokens',
+  'alerts',
+  'auto-alerts',
+  'check-alert-rules',
+  'aws-realtime-metrics',
+  'fetch-cloudwatch-metrics',
+  'fetch-edge-services',
+  'endpoint-monitor-check',
+  'monitored-endpoints',
+  'generate-error-fix-prompt',
+  'get-platform-metrics',
+  'get-recent-errors',
+  'list-aws-credentials',
+  'save-aws-credentials',
+  'update-aws-credentials',
+  'azure-oauth-initiate',
+  'azure-oauth-callback',
+  'azure-oauth-refresh',
+  'azure-oauth-revoke',
+  'validate-azure-credentials',
+  'save-azure-credentials',
+  'list-azure-credentials',
+  'delete-azure-credentials',
+  'azure-security-scan',
+  'start-azure-security-scan',
+  'azure-defender-scan',
+  'azure-compliance-scan',
+  'azure-well-architected-scan',
+  'azure-cost-optimization',
+  'azure-reservations-analyzer',
+  'azure-fetch-costs',
+  'azure-resource-inventory',
+  'azure-activity-logs',
+  'azure-fetch-monitor-metrics',
+  'azure-detect-anomalies',
+  'azure-fetch-edge-services',
+  'list-cloud-credentials',
+  'validate-license',
+  'configure-license',
+  'sync-license',
+  'admin-sync-license',
+  'manage-seats',
+  'daily-license-validation',
+  'kb-analytics-dashboard',
+  'kb-ai-suggestions',
+  'kb-export-pdf',
+  'increment-article-views',
+  'increment-article-helpful',
+  'track-article-view-detailed',
+  'generate-pdf-report',
+  'generate-excel-report',
+  'generate-security-pdf',
+  'security-scan-pdf-export',
+  'generate-remediation-script',
+  'query-table',
+  'mutate-table',
+  'ticket-management',
+  'ticket-attachments',
+  'create-organization-account',
+  'sync-organization-accounts',
+  'check-organization',
+  'create-with-organization',
+  'get-user-organization',
+  'send-email',
+  'send-notification',
+  'get-communication-logs',
+  'manage-email-preferences',
+  'send-scheduled-emails',
+  'storage-download',
+  'storage-delete',
+  'upload-attachment',
+  'process-background-jobs',
+  'list-background-jobs',
+  'execute-scheduled-job',
+  'scheduled-scan-executor',
+  'create-jira-ticket',
+];
+
+// Endpoints served without the Cognito authorizer (auth column, keyed by endpoint)
+const PUBLIC_ENDPOINTS = new Set<string>([
+  'get-executive-dashboard-public',
+]);
+
+const clientConfig = {
+  region: REGION,
+  credentials: fromIni({ profile: PROFILE }),
+  maxAttempts: 10,
+  retryMode: 'adaptive',
+};
+
+// Caps each client's sockets at the endpoint concurrency (the SDK default agent allows 50)
+function createRequestHandler() {
+  return { httpsAgent: new Agent({ keepAlive: true, maxSockets: MAX_PARALLEL }) };
+}
+
+// Clients are created on first use and reused for every call
+let apigwClient: APIGatewayClient | undefined;
+let lambdaClient: LambdaClient | undefined;
+
+function getApiGatewayClient(): APIGatewayClient {
+  return apigwClient ??= new APIGatewayClient({ ...clientConfig, requestHandler: createRequestHandler() });
+}
+
+function getLambdaClient(): LambdaClient {
+  return lambdaClient ??= new LambdaClient({ ...clientConfig, requestHandler: createRequestHandler() });
+}
+
+interface ExistingResource {
+  id: string;
+  resourceMethods: Record<string, Method>;
+}
+
+/**
+ * Lists every resource on the API once (with its methods embedded), so re-runs can
+ * skip complete endpoints and repair half-built ones without re-listing the API
+ */
+async function getExistingResources(): Promise<Map<string, ExistingResource>> {
+  const resources = new Map<string, ExistingResource>();
+  const pages = paginateGetResources(
+    { client: getApiGatewayClient() },
+    { restApiId: API_ID, limit: 500, embed: ['methods'] },
+  );
+  for await (const page of pages) {
+    for (const resource of page.items ?? []) {
+      if (resource.path && resource.id) {
+        resources.set(resource.path, { id: resource.id, resourceMethods: resource.resourceMethods ?? {} });
+      }
+    }
+  }
+  return resources;
+}
+
+/**
+ * Whether the POST method uses the authorizer this endpoint should have
+ * (none for PUBLIC_ENDPOINTS, the Cognito authorizer otherwise)
+ */
+function hasExpectedAuth(endpoint: string, post: Method): boolean {
+  if (PUBLIC_ENDPOINTS.has(endpoint)) {
+    return post.authorizationType === 'NONE';
+  }
+  return post.authorizationType === 'COGNITO_USER_POOLS' && post.authorizerId === AUTHORIZER_ID;
+}
+
+/**
+ * An endpoint is complete when its CORS preflight and its Lambda-backed POST are fully wired
+ * and the POST uses the expected authorizer
+ */
+export function isEndpointComplete(endpoint: string, methods: Record<string, Method>): boolean {
+  const options = methods.OPTIONS;
+  const post = methods.POST;
+  return Boolean(
+    options?.methodResponses?.['200'] &&
+    options.methodIntegration?.integrationResponses?.['200'] &&
+    post?.methodIntegration &&
+    hasExpectedAuth(endpoint, post),
+  );
+}
+
+/**
+ * Retries a call on a transient conflict (by default API Gateway's ConflictException)
+ * with exponential backoff and jitter
+ */
+export async function withConflictRetry<T>(
+  call: () => Promise<T>,
+  isConflict: (err: unknown) => boolean = err => err instanceof ConflictException,
+): Promise<T> {
+  for (let attempt = 1; ; attempt++) {
+    try {
+      return await call();
+    } catch (err) {
+      if (!isConflict(err) || attempt >= CONFLICT_MAX_ATTEMPTS) throw err;
+      const delayMs = CONFLICT_BASE_DELAY_MS * 2 ** (attempt - 1) * (0.5 + Math.random());
+      await new Promise(resolve => setTimeout(resolve, delayMs));
+    }
+  }
+}
+
+async function createEndpoint(endpoint: string, existingResources: Map<string, ExistingResource>): Promise<void> {
+  const existing = existingResources.get(`/api/functions/${endpoint}`);
+
+  // Existing resource: add only what is missing. The Lambda permission can't be seen from
+  // API Gateway, so it is (idempotently) granted even when the methods are complete.
+  if (existing) {
+    const complete = isEndpointComplete(endpoint, existing.resourceMethods);
+    if (!complete) {
+      console.log(`🔧 Repairing ${endpoint}...`);
+    }
+    await configureEndpoint(endpoint, existing.id, existing.resourceMethods);
+    console.log(complete ? `⏭️  ${endpoint} already exists` : `✅ ${endpoint} repaired`);
+    return;
+  }
+
+  console.log(`Creating ${endpoint}...`);
+
+  const resource = await withConflictRetry(() => getApiGatewayClient().send(new CreateResourceCommand({
+    restApiId: API_ID,
+    parentId: PARENT_ID,
+    pathPart: endpoint,
+  })));
+  const resourceId = resource.id!;
+
+  // Finish the endpoint or remove the new resource, so a failure never leaves it half-built
+  try {
+    await configureEndpoint(endpoint, resourceId);
+  } catch (err) {
+    console.log(`↩️  ${endpoint}: rolling back resource ${resourceId}`);
+    await withConflictRetry(() => getApiGatewayClient().send(new DeleteResourceCommand({
+      restApiId: API_ID,
+      resourceId,
+    }))).catch(deleteErr => {
+      console.log(`⚠️  ${endpoint}: rollback failed (${(deleteErr as Error).message})`);
+    });
+    throw err;
+  }
+
+  console.log(`✅ ${endpoint} created`);
+}
+
+/**
+ * Puts the OPTIONS/POST methods, integrations and Lambda permission for an endpoint,
+ * skipping any part already present in `methods`
+ */
+async function configureEndpoint(
+  endpoint: string,
+  resourceId: string,
+  methods: Record<string, Method> = {},
+): Promise<void> {
+  const lambdaName = `${LAMBDA_PREFIX}-${endpoint}`;
+  const lambdaArn = `arn:aws:lambda:${REGION}:${ACCOUNT_ID}:function:${lambdaName}`;
+
+  // OPTIONS
+  const options = methods.OPTIONS;
+  if (!options) {
+    await withConflictRetry(() => getApiGatewayClient().send(new PutMethodCommand({
+      restApiId: API_ID,
+      resourceId,
+      httpMethod: 'OPTIONS',
+      authorizationType: 'NONE',
+    })));
+  }
+  if (!options?.methodIntegration) {
+    await withConflictRetry(() => getApiGatewayClient().send(new PutIntegrationCommand({
+      restApiId: API_ID,
+      resourceId,
+      httpMethod: 'OPTIONS',
+      type: 'MOCK',
+      requestTemplates: { 'application/json': '{"statusCode": 200}' },
+    })));
+  }
+  if (!options?.methodResponses?.['200']) {
+    await withConflictRetry(() => getApiGatewayClient().send(new PutMethodResponseCommand({
+      restApiId: API_ID,
+      resourceId,
+      httpMethod: 'OPTIONS',
+      statusCode: '200',
+      responseParameters: {
+        'method.response.header.Access-Control-Allow-Headers': true,
+        'method.response.header.Access-Control-Allow-Methods': true,
+        'method.response.header.Access-Control-Allow-Origin': true,
+      },
+    })));
+  }
+  if (!options?.methodIntegration?.integrationResponses?.['200']) {
+    await withConflictRetry(() => getApiGatewayClient().send(new PutIntegrationResponseCommand({
+      restApiId: API_ID,
+      resourceId,
+      httpMethod: 'OPTIONS',
+      statusCode: '200',
+      responseParameters: {
+        'method.response.header.Access-Control-Allow-Headers': `'${CORS_HEADERS}'`,
+        'method.response.header.Access-Control-Allow-Methods': `'${CORS_METHODS}'`,
+        'method.response.header.Access-Control-Allow-Origin': "'*'",
+      },
+    })));
+  }
+
+  // POST
+  const post = methods.POST;
+  const isPublic = PUBLIC_ENDPOINTS.has(endpoint);
+  if (!post) {
+    await withConflictRetry(() => getApiGatewayClient().send(new PutMethodCommand({
+      restApiId: API_ID,
+      resourceId,
+      httpMethod: 'POST',
+      authorizationType: isPublic ? 'NONE' : 'COGNITO_USER_POOLS',
+      authorizerId: isPublic ? undefined : AUTHORIZER_ID,
+    })));
+  }
+  if (!post?.methodIntegration) {
+    await withConflictRetry(() => getApiGatewayClient().send(new PutIntegrationCommand({
+      restApiId: API_ID,
+      resourceId,
+      httpMethod: 'POST',
+      type: 'AWS_PROXY',
+      integrationHttpMethod: 'POST',
+      uri: `arn:aws:apigateway:${REGION}:lambda:path/2015-03-31/functions/${lambdaArn}/invocations`,
+    })));
+  }
+  if (post && !hasExpectedAuth(endpoint, post)) {
+    await withConflictRetry(() => getApiGatewayClient().send(new UpdateMethodCommand({
+      restApiId: API_ID,
+      resourceId,
+      httpMethod: 'POST',
+      patchOperations: isPublic
+        ? [{ op: 'replace', path: '/authorizationType', value: 'NONE' }]
+        : [
+          { op: 'replace', path: '/authorizationType', value: 'COGNITO_USER_POOLS' },
+          { op: 'replace', path: '/authorizerId', value: AUTHORIZER_ID },
+        ],
+    })));
+  }
+
+  // Lambda permission (StatementId is stable per endpoint, so "already exists" means it is granted;
+  // any other conflict, e.g. "An update is in progress", is transient and retried)
+  await withConflictRetry(
+    () => getLambdaClient().send(new AddPermissionCommand({
+      FunctionName: lambdaName,
+      StatementId: `apigateway-${endpoint}`,
+      Action: 'lambda:InvokeFunction',
+      Principal: 'apigateway.amazonaws.com',
+      SourceArn: `arn:aws:execute-api:${REGION}:${ACCOUNT_ID}:${API_ID}/*/POST/api/functions/${endpoint}`,
+    })),
+    err => err instanceof ResourceConflictException && !isStatementExists(err),
+  ).catch(err => {
+    if (!isStatementExists(err)) throw err;
+  });
+}
+
+function isStatementExists(err: unknown): boolean {
+  return err instanceof ResourceConflictException && /already exists/i.test(err.message);
+}
+
+async function runEndpoint(endpoint: string, existingResources: Map<string, ExistingResource>): Promise<boolean> {
+  try {
+    await createEndpoint(endpoint, existingResources);
+    return true;
+  } catch (err) {
+    console.log(`❌ Failed: ${endpoint} (${(err as Error).message})`);
+    return false;
+  }
+}
+
+async function main(): Promise<void> {
+  const existingResources = await getExistingResources();
+
+  // Fixed pool of MAX_PARALLEL workers pulling the next endpoint from a shared index
+  const results: boolean[] = [];
+  let next = 0;
+  const worker = async (): Promise<void> => {
+    while (next < ENDPOINTS.length) {
+      const i = next++;
+      results[i] = await runEndpoint(ENDPOINTS[i], existingResources);
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(MAX_PARALLEL, ENDPOINTS.length) }, worker));
+
+  const success = results.filter(Boolean).length;
+  const failed = results.length - success;
+  console.log(`Endpoints: ${success} ok, ${failed} failed`);
+  if (failed > 0) {
+    process.exitCode = 1;
+  }
+
+  console.log('Deploying API...');
+  await withConflictRetry(() => getApiGatewayClient().send(new CreateDeploymentCommand({ restApiId: API_ID, stageName: 'prod' })));
+  console.log('✅ Done');
+}
+
+// Run only when executed directly (not imported)
+if (import.meta.url === `file://${process.argv[1]}`) {
+  main().catch(error => {
+    console.error('❌ Endpoint creation failed:', error);
+    process.exit(1);
+  });
+}
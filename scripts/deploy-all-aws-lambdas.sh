@@ -21,6 +21,10 @@ NC='\033[0m'
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 REGION="us-east-1"
 
+# Retry adaptativo do AWS CLI (backoff em throttling) em vez de sleep fixo entre deploys
+export AWS_RETRY_MODE="adaptive"
+export AWS_MAX_ATTEMPTS="10"
+
 # Lista de handlers que usam aws-helpers.js
 # Formato: "handler-path:lambda-name"
 HANDLERS=(
@@ -136,9 +140,6 @@ for entry in "${HANDLERS[@]}"; do
     
     # Cleanup
     rm -rf "$DEPLOY_DIR"
-    
-    # Small delay to avoid rate limiting
-    sleep 1
 done
 
 echo -e "\n${YELLOW}========================================${NC}"
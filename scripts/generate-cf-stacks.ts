@@ -260,10 +260,51 @@ const OUTPUT_DIR = 'cloudformation';
 const CORS_HEADERS = 'Content-Type,Authorization,X-Requested-With,X-API-Key,X-Request-ID,X-CSRF-Token,X-Correlation-ID,X-Amz-Date,X-Amz-Security-Token,X-Impersonate-Organization';
 const CORS_METHODS = 'GET,POST,PUT,DELETE,OPTIONS';
 
+// Static YAML shared by every Lambda function (built once, not per handler)
+const LAMBDA_SHARED_PROPS = `
+      VpcConfig:
+        SecurityGroupIds: !Ref LambdaSecurityGroupIds
+        SubnetIds: !Ref PrivateSubnetIds
+      Layers:
+        - !Ref LambdaLayerArn
+      Environment:
+        Variables:
+          DATABASE_URL: !Ref DatabaseUrl
+          NODE_PATH: /opt/nodejs/node_modules
+          COGNITO_USER_POOL_ID: !Ref CognitoUserPoolId
+          AWS_ACCOUNT_ID: !Ref AWS::AccountId`;
+
+// Static YAML shared by every CORS preflight (OPTIONS) method
+const OPTIONS_METHOD_PROPS = `
+      AuthorizationType: NONE
+      Integration:
+        Type: MOCK
+        RequestTemplates:
+          application/json: '{"statusCode": 200}'
+        IntegrationResponses:
+          - StatusCode: 200
+            ResponseParameters:
+              method.response.header.Access-Control-Allow-Headers: "'${CORS_HEADERS}'"
+              method.response.header.Access-Control-Allow-Methods: "'${CORS_METHODS}'"
+              method.response.header.Access-Control-Allow-Origin: "'*'"
+      MethodResponses:
+        - StatusCode: 200
+          ResponseParameters:
+            method.response.header.Access-Control-Allow-Headers: true
+            method.response.header.Access-Control-Allow-Methods: true
+            method.response.header.Access-Control-Allow-Origin: true`;
+
 function toPascalCase(str: string): string {
   return str.split('-').map(w => w.charAt(0).toUpperCase() + w.slice(1)).join('');
 }
 
+// CloudFormation resource name per handler, computed once (used by Lambda, API and Outputs blocks)
+const RESOURCE_NAMES = new Map(HANDLERS.map(h => [h.name, toPascalCase(h.name)]));
+
+function resourceName(h: HandlerConfig): string {
+  return RESOURCE_NAMES.get(h.name)!;
+}
+
 // Group handlers by category
 function groupByCategory(handlers: HandlerConfig[]): Map<string, HandlerConfig[]> {
   const groups = new Map<string, HandlerConfig[]>();
@@ -277,7 +318,7 @@ function groupByCategory(handlers: HandlerConfig[]): Map<string, HandlerConfig[]
 
 // Generate Lambda function YAML
 function genLambda(h: HandlerConfig): string {
-  const name = toPascalCase(h.name);
+  const name = resourceName(h);
   return `
   ${name}Function:
     Type: AWS::Lambda::Function
@@ -290,24 +331,13 @@ function genLambda(h: HandlerConfig): string {
         S3Key: !Sub 'lambdas/${h.name}.zip'
       Role: !Ref LambdaExecutionRoleArn
       Timeout: ${h.timeout || DEFAULT_TIMEOUT}
-      MemorySize: ${h.memory || DEFAULT_MEMORY}
-      VpcConfig:
-        SecurityGroupIds: !Ref LambdaSecurityGroupIds
-        SubnetIds: !Ref PrivateSubnetIds
-      Layers:
-        - !Ref LambdaLayerArn
-      Environment:
-        Variables:
-          DATABASE_URL: !Ref DatabaseUrl
-          NODE_PATH: /opt/nodejs/node_modules
-          COGNITO_USER_POOL_ID: !Ref CognitoUserPoolId
-          AWS_ACCOUNT_ID: !Ref AWS::AccountId`;
+      MemorySize: ${h.memory || DEFAULT_MEMORY}${LAMBDA_SHARED_PROPS}`;
 }
 
 // Generate API endpoint YAML (Resource + Methods + Permission)
 function genApiEndpoint(h: HandlerConfig): string {
   if (h.scheduled) return '';
-  const name = toPascalCase(h.name);
+  const name = resourceName(h);
   const authType = h.auth === 'NONE' ? 'NONE' : 'COGNITO_USER_POOLS';
   const authLine = h.auth === 'NONE' ? '' : '\n      AuthorizerId: !Ref AuthorizerId';
   
@@ -324,24 +354,7 @@ function genApiEndpoint(h: HandlerConfig): string {
     Properties:
       RestApiId: !Ref RestApiId
       ResourceId: !Ref ${name}Resource
-      HttpMethod: OPTIONS
-      AuthorizationType: NONE
-      Integration:
-        Type: MOCK
-        RequestTemplates:
-          application/json: '{"statusCode": 200}'
-        IntegrationResponses:
-          - StatusCode: 200
-            ResponseParameters:
-              method.response.header.Access-Control-Allow-Headers: "'${CORS_HEADERS}'"
-              method.response.header.Access-Control-Allow-Methods: "'${CORS_METHODS}'"
-              method.response.header.Access-Control-Allow-Origin: "'*'"
-      MethodResponses:
-        - StatusCode: 200
-          ResponseParameters:
-            method.response.header.Access-Control-Allow-Headers: true
-            method.response.header.Access-Control-Allow-Methods: true
-            method.response.header.Access-Control-Allow-Origin: true
+      HttpMethod: OPTIONS${OPTIONS_METHOD_PROPS}
 
   ${name}PostMethod:
     Type: AWS::ApiGateway::Method
@@ -365,9 +378,8 @@ function genApiEndpoint(h: HandlerConfig): string {
 }
 
 
-// Generate nested stack parameters header
-function genNestedStackParams(): string {
-  return `AWSTemplateFormatVersion: '2010-09-09'
+// Nested stack parameters header (identical for every category, built once)
+const NESTED_STACK_HEADER = `AWSTemplateFormatVersion: '2010-09-09'
 Description: EVO Platform - Nested Stack
 
 Parameters:
@@ -398,7 +410,6 @@ Parameters:
     Type: String
 
 Resources:`;
-}
 
 // Generate master stack
 function genMasterStack(categories: string[], s3Bucket: string): string {
@@ -492,31 +503,32 @@ async function main(): Promise<void> {
   for (const [category, handlers] of groups) {
     console.log(`  📦 ${category}: ${handlers.length} handlers`);
     
-    let content = genNestedStackParams();
+    // Use array for efficient string building
+    const parts: string[] = [NESTED_STACK_HEADER];
     
     // Add Lambda functions
     for (const h of handlers) {
-      content += genLambda(h);
+      parts.push(genLambda(h));
     }
     
     // Add API endpoints (only for non-scheduled)
     for (const h of handlers) {
-      content += genApiEndpoint(h);
+      parts.push(genApiEndpoint(h));
     }
     
     // Add outputs
-    content += '\n\nOutputs:';
+    parts.push('\n\nOutputs:');
     for (const h of handlers) {
-      const name = toPascalCase(h.name);
-      content += `
+      const name = resourceName(h);
+      parts.push(`
   ${name}FunctionArn:
     Value: !GetAtt ${name}Function.Arn
     Export:
-      Name: !Sub '\${ProjectName}-\${Environment}-${h.name}-arn'`;
+      Name: !Sub '\${ProjectName}-\${Environment}-${h.name}-arn'`);
     }
     
     const filePath = path.join(nestedDir, `evo-${category}-stack.yaml`);
-    fs.writeFileSync(filePath, content, 'utf8');
+    fs.writeFileSync(filePath, parts.join(''), 'utf8');
   }
   
   // Generate master stack
@@ -23,6 +23,10 @@ PREFIX="evo-uds-v3-${ENV}"
 REGION="us-east-1"
 PROFILE="${2:-EVO_PRODUCTION}"
 
+# Let the CLI back off on throttling (token bucket + jitter) instead of sleeping between calls
+export AWS_RETRY_MODE="adaptive"
+export AWS_MAX_ATTEMPTS="10"
+
 # Variables to update — read from environment or .env file, never hardcode secrets
 TOKEN_ENCRYPTION_KEY="${TOKEN_ENCRYPTION_KEY:?ERROR: TOKEN_ENCRYPTION_KEY not set. Export it or source .env first.}"
 AZURE_OAUTH_REDIRECT_URI="${AZURE_OAUTH_REDIRECT_URI:-https://evo.nuevacore.com/azure/callback}"
@@ -114,9 +118,6 @@ for FUNC in $FUNCTIONS; do
     echo "FAILED"
     FAILED=$((FAILED + 1))
   fi
-  
-  # Small delay to avoid API throttling
-  sleep 0.3
 done
 
 echo ""